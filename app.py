@@ -1,16 +1,38 @@
 \
 from __future__ import annotations
 
+import math
+import queue
 import time
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import customtkinter as ctk
+import cv2
+import numpy as np
 from tkinter import filedialog, messagebox, Canvas
 from PIL import Image, ImageTk
 
-from ocr_core import OCRConfig, run_ocr, export_txt, export_csv, export_overlay_png
+from ocr_core import (
+    OCRConfig,
+    run_ocr_image,
+    build_result,
+    warmup,
+    decode_image,
+    decode_reduction,
+    cache_key,
+    load_cached_result,
+    save_cached_result,
+    encode_png,
+    export_txt,
+    export_csv,
+    export_overlay_png,
+)
+
+# long-side cap for the overlay preview image; the full-res overlay is kept only as PNG bytes
+OVERLAY_PREVIEW_MAX_SIDE = 2560
 
 
 class ZoomPanCanvas(ctk.CTkFrame):
@@ -20,16 +42,24 @@ class ZoomPanCanvas(ctk.CTkFrame):
         self.canvas = Canvas(self, highlightthickness=0, bg="#1e1e1e")
         self.canvas.pack(expand=True, fill="both")
 
+        self._src: Image.Image | None = None
         self._img_pil: Image.Image | None = None
+        self._levels: list[Image.Image] = []
         self._img_tk: ImageTk.PhotoImage | None = None
         self._img_id = None
+        self._last_key: tuple[int, ...] | None = None
+        # per source image: (src, rgb, levels, last_key, img_tk), so toggling back needs no resample
+        self._rendered_cache: dict[int, tuple] = {}
+        self._cache_limit = 2
 
         self._scale = 1.0
         self._min_scale = 0.15
         self._max_scale = 8.0
 
+        self._redraw_pending = False
+
         self._pan_start = None  # (x, y)
-        self._offset = [0.0, 0.0]   # (dx, dy)
+        self._offset = np.zeros(2, dtype=np.float64)   # (dx, dy)
 
         self.canvas.bind("<ButtonPress-1>", self._on_pan_start)
         self.canvas.bind("<B1-Motion>", self._on_pan_move)
@@ -43,22 +73,68 @@ class ZoomPanCanvas(ctk.CTkFrame):
 
         self.canvas.bind("<Configure>", lambda e: self._redraw())
 
-    def set_image(self, pil_img: Image.Image):
-        self._img_pil = pil_img.convert("RGB")
-        self._scale = 1.0
-        self._offset = [0.0, 0.0]
-        self._redraw(fit=True)
+    def set_image(self, pil_img: Image.Image, view: tuple[float, tuple[float, float]] | None = None):
+        self._stash_render()
+        cached = self._rendered_cache.pop(id(pil_img), None)
+        if cached is not None and cached[0] is pil_img:
+            _, self._img_pil, self._levels, self._last_key, self._img_tk = cached
+        else:
+            # App already hands over RGB images; convert() would still make a full copy
+            self._img_pil = pil_img if pil_img.mode == "RGB" else pil_img.convert("RGB")
+            self._levels = self._build_levels(self._img_pil)
+            self._last_key = None
+            self._img_tk = None
+        self._src = pil_img
+
+        if view is None:
+            self._scale = 1.0
+            self._offset = np.zeros(2, dtype=np.float64)
+            self._redraw(fit=True)
+        else:
+            self._scale, offset = view
+            self._offset = np.array(offset, dtype=np.float64)
+            self._redraw()
+
+    def get_view(self) -> tuple[float, tuple[float, float]]:
+        return self._scale, (float(self._offset[0]), float(self._offset[1]))
 
     def clear(self):
+        self._src = None
         self._img_pil = None
+        self._levels = []
         self._img_tk = None
+        self._last_key = None
+        self._rendered_cache.clear()
         if self._img_id is not None:
             self.canvas.delete(self._img_id)
             self._img_id = None
 
+    def _stash_render(self):
+        if self._src is None:
+            return
+        self._rendered_cache[id(self._src)] = (self._src, self._img_pil, self._levels, self._last_key, self._img_tk)
+        while len(self._rendered_cache) > self._cache_limit:
+            self._rendered_cache.pop(next(iter(self._rendered_cache)))
+
+    @staticmethod
+    def _build_levels(img: Image.Image, min_side: int = 512) -> list[Image.Image]:
+        # display pyramid (1x, 1/2, 1/4, ...) so zooming out never resamples the full-res source
+        levels = [img]
+        while max(levels[-1].size) > min_side:
+            w, h = levels[-1].size
+            levels.append(levels[-1].resize((max(1, w // 2), max(1, h // 2)), Image.BILINEAR))
+        return levels
+
+    def _pick_level(self, nw: int) -> Image.Image:
+        # smallest level that is still at least as wide as the target
+        for lvl in reversed(self._levels):
+            if lvl.width >= nw:
+                return lvl
+        return self._levels[0]
+
     def reset_view(self, event=None):
         self._scale = 1.0
-        self._offset = [0.0, 0.0]
+        self._offset = np.zeros(2, dtype=np.float64)
         self._redraw(fit=True)
 
     def _on_pan_start(self, event):
@@ -68,12 +144,9 @@ class ZoomPanCanvas(ctk.CTkFrame):
         if self._pan_start is None:
             return
         x0, y0 = self._pan_start
-        dx = event.x - x0
-        dy = event.y - y0
-        self._offset[0] += dx
-        self._offset[1] += dy
+        self._offset += (event.x - x0, event.y - y0)
         self._pan_start = (event.x, event.y)
-        self._redraw()
+        self._schedule_redraw()
 
     def _on_wheel_windows(self, event):
         if event.delta > 0:
@@ -94,9 +167,19 @@ class ZoomPanCanvas(ctk.CTkFrame):
             return
 
         # zoom around cursor (keep point under cursor stable)
-        self._offset[0] = cx - (cx - self._offset[0]) * (new / old)
-        self._offset[1] = cy - (cy - self._offset[1]) * (new / old)
+        cxy = np.array((cx, cy), dtype=np.float64)
+        self._offset = cxy - (cxy - self._offset) * (new / old)
         self._scale = new
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        # coalesce bursts of wheel/drag events into one redraw per ~frame
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after(16, self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
         self._redraw()
 
     def _redraw(self, fit: bool = False):
@@ -113,22 +196,56 @@ class ZoomPanCanvas(ctk.CTkFrame):
             self._scale = max(self._min_scale, min(self._max_scale, s))
             dw = iw * self._scale
             dh = ih * self._scale
-            self._offset = [(cw - dw) / 2.0, (ch - dh) / 2.0]
+            self._offset = np.array(((cw - dw) / 2.0, (ch - dh) / 2.0))
 
         nw = max(1, int(iw * self._scale))
         nh = max(1, int(ih * self._scale))
-        resized = self._img_pil.resize((nw, nh), Image.BICUBIC)
 
-        self._img_tk = ImageTk.PhotoImage(resized)
+        ox, oy = float(self._offset[0]), float(self._offset[1])
+        if -ox >= iw * self._scale or ox >= cw or -oy >= ih * self._scale or oy >= ch:
+            # panned fully out of view
+            if self._img_id is not None:
+                self.canvas.itemconfig(self._img_id, state="hidden")
+            return
+
+        # only about a canvas' worth of the source is resampled; the span depends on the
+        # scale alone, so the tile keeps its size while panning and can be pasted in place
+        span_x = min(iw, math.ceil(cw / self._scale) + 1)
+        span_y = min(ih, math.ceil(ch / self._scale) + 1)
+        sx0 = min(max(0, math.floor(-ox / self._scale)), iw - span_x)
+        sy0 = min(max(0, math.floor(-oy / self._scale)), ih - span_y)
+        sx1 = sx0 + span_x
+        sy1 = sy0 + span_y
+
+        tw = max(1, round(span_x * self._scale))
+        th = max(1, round(span_y * self._scale))
+
+        # panning with the whole image visible only moves it; resample only when the region changes
+        key = (nw, nh, sx0, sy0, sx1, sy1)
+        if self._img_tk is None or self._last_key != key:
+            lvl = self._pick_level(nw)
+            fx, fy = lvl.width / iw, lvl.height / ih
+            box = (sx0 * fx, sy0 * fy, sx1 * fx, sy1 * fy)
+            resized = lvl.resize((tw, th), Image.BICUBIC, box=box)
+            if self._img_tk is not None and (self._img_tk.width(), self._img_tk.height()) == (tw, th):
+                # same size (typical while panning zoomed-in): reuse the Tk image
+                self._img_tk.paste(resized)
+            else:
+                # release the old Tk image before allocating the new one to keep peak memory down
+                if self._img_id is not None:
+                    self.canvas.itemconfig(self._img_id, image="")
+                self._img_tk = None
+                self._img_tk = ImageTk.PhotoImage(resized)
+            self._last_key = key
 
-        x = self._offset[0]
-        y = self._offset[1]
+        x = ox + sx0 * self._scale
+        y = oy + sy0 * self._scale
 
         if self._img_id is None:
             self._img_id = self.canvas.create_image(x, y, anchor="nw", image=self._img_tk)
         else:
             self.canvas.coords(self._img_id, x, y)
-            self.canvas.itemconfig(self._img_id, image=self._img_tk)
+            self.canvas.itemconfig(self._img_id, image=self._img_tk, state="normal")
 
 
 class App(ctk.CTk):
@@ -142,13 +259,20 @@ class App(ctk.CTk):
         ctk.set_default_color_theme("blue")
 
         self.image_path: Path | None = None
-        self.last_overlay_bgr = None
+        self.image_paths: list[Path] = []
+        # per-image OCR results of the current batch, filled in as the pipeline finishes them
+        self._results: dict[Path, dict] = {}
+        self.last_overlay_png: bytes | None = None
         self.last_lines: list[str] | None = None
         self._orig_pil: Image.Image | None = None
         self._overlay_pil: Image.Image | None = None
+        # per preview mode (scale, offset), restored when toggling back
+        self._views: dict[str, tuple[float, tuple[float, float]]] = {}
+        self._shown_mode: str | None = None
 
         self._running = False
         self._t0 = 0.0
+        self._text_gen = 0  # bumped on every _set_text so stale chunked inserts stop
 
         root = ctk.CTkFrame(self)
         root.pack(expand=True, fill="both", padx=12, pady=12)
@@ -162,6 +286,10 @@ class App(ctk.CTk):
         self.lbl_img = ctk.CTkLabel(header, text="No image selected", anchor="w")
         self.lbl_img.pack(side="left", expand=True, fill="x", padx=(0, 10))
 
+        self.file_menu = ctk.CTkOptionMenu(header, values=[""], command=self.on_file_selected, width=200)
+        self.file_menu.pack(side="left", padx=(0, 8), pady=10, before=self.lbl_img)
+        self.file_menu.pack_forget()
+
         self.btn_export_txt = ctk.CTkButton(header, text="Export TXT", command=self.export_txt_file, state="disabled", width=110)
         self.btn_export_txt.pack(side="right", padx=(8, 10), pady=10)
 
@@ -244,6 +372,9 @@ class App(ctk.CTk):
         self.scale_entry.insert(0, "2.5")
         self.scale_entry.pack(side="right", padx=(0, 18))
 
+        # load the default reader in the background so the first Run OCR skips model loading
+        threading.Thread(target=warmup, args=(OCRConfig(lang="en", gpu=False),), daemon=True).start()
+
     def _set_export_buttons(self, enabled: bool):
         state = "normal" if enabled else "disabled"
         self.btn_export_overlay.configure(state=state)
@@ -251,43 +382,141 @@ class App(ctk.CTk):
         self.btn_export_csv.configure(state=state)
 
     def pick_image(self):
-        path = filedialog.askopenfilename(
-            title="Select image",
+        paths = filedialog.askopenfilenames(
+            title="Select image(s)",
             filetypes=[("Images", "*.png;*.jpg;*.jpeg;*.bmp;*.tif;*.tiff"), ("All files", "*.*")]
         )
-        if not path:
+        if not paths:
             return
 
-        self.image_path = Path(path)
+        self.image_paths = [Path(p) for p in paths]
+        self._results = {}
+
+        if len(self.image_paths) > 1:
+            self.file_menu.configure(values=self._file_labels())
+            self.file_menu.set(self._file_labels()[0])
+            self.file_menu.pack(side="left", padx=(0, 8), pady=10, before=self.lbl_img)
+        else:
+            self.file_menu.pack_forget()
+
+        self._select_image(self.image_paths[0])
+        n = len(self.image_paths)
+        self.status.configure(text="Status: Ready (image loaded)" if n == 1 else f"Status: Ready ({n} images loaded)")
+
+    def _file_labels(self) -> list[str]:
+        return [f"{i}. {p.name}" for i, p in enumerate(self.image_paths, start=1)]
+
+    def on_file_selected(self, value: str):
+        idx = self._file_labels().index(value)
+        self._select_image(self.image_paths[idx])
+
+    def _select_image(self, path: Path):
+        self.image_path = path
         self.lbl_img.configure(text=str(self.image_path))
 
-        self.last_overlay_bgr = None
+        self.last_overlay_png = None
         self.last_lines = None
         self._overlay_pil = None
 
-        self._orig_pil = Image.open(self.image_path).convert("RGB")
+        # decode off the UI thread; the preview stays empty until it is ready
+        self._orig_pil = None
+        self.preview.clear()
+        self._views = {}
+        self._shown_mode = None
         self.preview_toggle.set("Original")
-        self.preview.set_image(self._orig_pil)
+        threading.Thread(target=self._decode_and_show, args=(path,), daemon=True).start()
 
-        self.textbox.delete("1.0", "end")
+        self._set_text([])
         self._set_export_buttons(False)
         self.lbl_summary.configure(text="Theme: -  |  Words: -  |  Lines: -  |  Avg conf: -")
-        self.status.configure(text="Status: Ready (image loaded)")
+
+        res = self._results.get(path)
+        if res is not None:
+            self._show_result_text(res)
+            if res.get("overlay_pil") is not None:
+                self._show_result_overlay(res)
+
+    def _decode_and_show(self, path: Path):
+        try:
+            pil = Image.open(path).convert("RGB")
+        except Exception:
+            err = traceback.format_exc()
+            self.after(0, lambda: self._on_decode_error(path, err))
+            return
+        self.after(0, lambda: self._on_image_decoded(path, pil))
+
+    def _on_image_decoded(self, path: Path, pil: Image.Image):
+        if path != self.image_path:
+            return  # another image was selected meanwhile
+        self._orig_pil = pil
+        if self._shown_mode != "Overlay":
+            self._show_preview("Original")
+
+    def _on_decode_error(self, path: Path, err: str):
+        if path != self.image_path:
+            return
+        self.status.configure(text="Status: Error")
+        messagebox.showerror("Error", err)
+
+    def _show_result_text(self, res: dict):
+        self.last_lines = res["lines"]
+        self._set_text(res["lines"])
+        self.lbl_summary.configure(
+            text=f"Theme: {res['theme']}  |  Words: {res['word_count']}  |  Lines: {len(res['lines'])}  |  Avg conf: {res['avg_conf']:.2f}"
+        )
+        self.btn_export_txt.configure(state="normal")
+        self.btn_export_csv.configure(state="normal")
+
+    def _set_text(self, lines: list[str], chunk: int = 1000, max_single: int = 10_000):
+        """Replace the textbox content; very long results are inserted in chunks on idle."""
+        self._text_gen += 1
+        gen = self._text_gen
+        self.textbox.delete("1.0", "end")
+        if len(lines) <= max_single:
+            self.textbox.insert("end", "\n".join(lines))
+            return
+
+        def insert_chunk(start: int):
+            if gen != self._text_gen:
+                return
+            sep = "\n" if start else ""
+            self.textbox.insert("end", sep + "\n".join(lines[start:start + chunk]))
+            if start + chunk < len(lines):
+                self.after_idle(insert_chunk, start + chunk)
+
+        insert_chunk(0)
+
+    def _show_result_overlay(self, res: dict):
+        self._overlay_pil = res["overlay_pil"]
+        self.last_overlay_png = res["overlay_png"]
+        self.btn_export_overlay.configure(state="normal")
+        self._views.pop("Overlay", None)
+        self.preview_toggle.set("Overlay")
+        self._show_preview("Overlay")
+
+    def _show_preview(self, mode: str):
+        img = self._orig_pil if mode == "Original" else self._overlay_pil
+        if self._shown_mode is not None:
+            self._views[self._shown_mode] = self.preview.get_view()
+        self.preview.set_image(img, view=self._views.get(mode))
+        self._shown_mode = mode
 
     def on_preview_toggle(self, value: str):
         if value == "Original":
             if self._orig_pil is not None:
-                self.preview.set_image(self._orig_pil)
+                self._show_preview("Original")
             else:
+                # still decoding: _on_image_decoded shows it once ready
                 self.preview.clear()
+                self._shown_mode = None
         else:
             if self._overlay_pil is not None:
-                self.preview.set_image(self._overlay_pil)
+                self._show_preview("Overlay")
             else:
                 messagebox.showinfo("Overlay not ready", "Run OCR first to generate overlay.")
                 self.preview_toggle.set("Original")
                 if self._orig_pil is not None:
-                    self.preview.set_image(self._orig_pil)
+                    self._show_preview("Original")
 
     def _start_loading(self):
         self._running = True
@@ -323,6 +552,7 @@ class App(ctk.CTk):
 
         self.status.configure(text="Status: Running OCR...")
         self.btn_run.configure(state="disabled")
+        self.btn_pick.configure(state="disabled")
         self._set_export_buttons(False)
         self._start_loading()
 
@@ -334,57 +564,165 @@ class App(ctk.CTk):
             use_allowlist=bool(self.allowlist_var.get()),
         )
 
-        def worker():
-            try:
-                out = run_ocr(self.image_path, cfg)
-
-                lines = out["lines"]
-                theme = out["theme"]
-                results = out["results"]
-                overlay_bgr = out["overlay_bgr"]
+        paths = list(self.image_paths)
+        self._results = {}
+
+        # four stages: loader thread (hash + decode) -> OCR thread -> post thread (overlay
+        # preview, PNG encode, cache write) -> UI thread (via after()).
+        # The bounded queue lets the next image decode while the current one is in OCR.
+        load_q: queue.Queue = queue.Queue(maxsize=2)
+        post = ThreadPoolExecutor(max_workers=1)
+
+        reduction = decode_reduction(cfg.scale)
+
+        def loader():
+            for path in paths:
+                try:
+                    # one read per image: the same bytes are hashed and decoded
+                    data = path.read_bytes()
+                    key = cache_key(data, cfg)
+                    bgr = decode_image(data, reduction)
+                    if bgr is None:
+                        raise ValueError(f"Not a readable image: {path}")
+                    out = None
+                    raw = load_cached_result(key)
+                    if raw is not None:
+                        # cached detections are unfiltered; min_conf and the overlay are applied here
+                        out = build_result(bgr, raw, cfg, reduction=reduction)
+                    load_q.put((path, key, out, bgr, None))
+                except Exception:
+                    load_q.put((path, None, None, None, traceback.format_exc()))
+            load_q.put(None)
 
-                word_count = len(results)
-                avg_conf = (sum([r[2] for r in results]) / word_count) if word_count else 0.0
-                line_count = len(lines)
-
-                self.last_lines = lines
-                self.last_overlay_bgr = overlay_bgr
+        def worker():
+            errors: list[tuple[Path, str]] = []
+            done = 0
+            while True:
+                item = load_q.get()
+                if item is None:
+                    break
+                path, key, out, bgr, err = item
+                done += 1
+
+                if err is None:
+                    try:
+                        cached = out is not None
+                        if not cached:
+                            out = run_ocr_image(bgr, cfg, reduction=reduction)
+                        res = self._publish_result(path, out, done, len(paths))
+                        # overlay work is off the OCR thread so the next image starts right away
+                        post.submit(self._publish_overlay, path, key, out, res, cached, len(paths), errors)
+                    except Exception:
+                        err = traceback.format_exc()
+
+                if err is not None:
+                    errors.append((path, err))
+
+            # queued behind the last overlay job, so the batch ends once every overlay is in
+            post.submit(self.after, 0, lambda: self._on_batch_done(len(paths), errors))
+            post.shutdown(wait=False)
+
+        threading.Thread(target=loader, daemon=True).start()
+        threading.Thread(target=worker, daemon=True).start()
 
-                import cv2
-                rgb = cv2.cvtColor(overlay_bgr, cv2.COLOR_BGR2RGB)
-                self._overlay_pil = Image.fromarray(rgb)
+    def _publish_result(self, path: Path, out: dict, done: int, total: int) -> dict:
+        """Called on the OCR thread: hand one image's text to the UI thread; returns its result entry."""
+        lines = out["lines"]
+
+        word_count = len(out["texts"])
+        avg_conf = float(out["confs"].mean()) if word_count else 0.0
+
+        res = {
+            "theme": out["theme"],
+            "lines": lines,
+            "word_count": word_count,
+            "avg_conf": avg_conf,
+            "overlay_pil": None,
+            "overlay_png": None,
+        }
+
+        def ui_update():
+            self._results[path] = res
+            if total > 1:
+                self.status.configure(text=f"Status: Running OCR... {done}/{total}")
+            if path == self.image_path:
+                self._show_result_text(res)
+
+        # show the text first; the overlay preview follows from _publish_overlay
+        self.after(0, ui_update)
+        return res
+
+    def _publish_overlay(self, path: Path, key: str, out: dict, res: dict, cached: bool, total: int,
+                         errors: list[tuple[Path, str]]):
+        """Called on the post thread: overlay preview, PNG and cache entry for one result."""
+        try:
+            overlay_bgr = out["overlay_bgr"]
+            # bounded-size preview; the full-res overlay is kept only as PNG bytes, which export writes as-is
+            h, w = overlay_bgr.shape[:2]
+            f = min(1.0, OVERLAY_PREVIEW_MAX_SIDE / max(h, w))
+            preview_bgr = overlay_bgr
+            if f < 1.0:
+                preview_bgr = cv2.resize(overlay_bgr, (max(1, round(w * f)), max(1, round(h * f))), interpolation=cv2.INTER_AREA)
+            overlay_pil = Image.fromarray(np.ascontiguousarray(preview_bgr[:, :, ::-1]))
+            # cached results already carry their PNG
+            overlay_png = out.get("overlay_png") or encode_png(overlay_bgr)
+            out["overlay_png"] = overlay_png
+        except Exception:
+            errors.append((path, traceback.format_exc()))
+            return
 
-                def ui_update():
-                    self._stop_loading()
-                    self.textbox.delete("1.0", "end")
-                    self.textbox.insert("1.0", "\n".join(lines))
-                    self.lbl_summary.configure(
-                        text=f"Theme: {theme}  |  Words: {word_count}  |  Lines: {line_count}  |  Avg conf: {avg_conf:.2f}"
-                    )
-                    self.status.configure(text="Status: Done")
-                    self.btn_run.configure(state="normal")
-                    self._set_export_buttons(True)
+        def ui_overlay():
+            res["overlay_pil"] = overlay_pil
+            res["overlay_png"] = overlay_png
+            if path == self.image_path:
+                self._show_result_overlay(res)
+            if total == 1:
+                self.status.configure(text="Status: Done (cached)" if cached else "Status: Done")
 
-                    self.preview_toggle.set("Overlay")
-                    self.preview.set_image(self._overlay_pil)
+        self.after(0, ui_overlay)
 
-                self.after(0, ui_update)
+        if not cached:
+            self._save_cache(key, out)
 
+    @staticmethod
+    def _save_cache(key: str, out: dict):
+        try:
+            save_cached_result(key, out)
+        except OSError:
+            pass  # cache is best-effort
+
+    def _on_batch_done(self, total: int, errors: list[tuple[Path, str]]):
+        self._stop_loading()
+        self.btn_run.configure(state="normal")
+        self.btn_pick.configure(state="normal")
+        if errors:
+            self.status.configure(text="Status: Error")
+            messagebox.showerror("Error", "\n\n".join(f"{p.name}:\n{err}" for p, err in errors))
+        elif total > 1:
+            self.status.configure(text=f"Status: Done ({total} images)")
+
+    def _export_async(self, export_fn, path: str, data, label: str):
+        """Write an export on a background thread; the UI only shows the outcome."""
+        self.status.configure(text=f"Status: Saving {label}...")
+
+        def job():
+            try:
+                export_fn(path, data)
             except Exception:
                 err = traceback.format_exc()
 
                 def ui_err():
-                    self._stop_loading()
                     self.status.configure(text="Status: Error")
-                    self.btn_run.configure(state="normal")
-                    messagebox.showerror("Error", err)
+                    messagebox.showerror("Export failed", err)
 
                 self.after(0, ui_err)
+                return
+            self.after(0, lambda: self.status.configure(text=f"Status: Saved {label} -> {Path(path).name}"))
 
-        threading.Thread(target=worker, daemon=True).start()
+        threading.Thread(target=job, daemon=True).start()
 
     def export_overlay(self):
-        if self.last_overlay_bgr is None or self.image_path is None:
+        if self.last_overlay_png is None or self.image_path is None:
             return
         default_name = f"{self.image_path.stem}_overlay.png"
         path = filedialog.asksaveasfilename(
@@ -395,8 +733,7 @@ class App(ctk.CTk):
         )
         if not path:
             return
-        export_overlay_png(path, self.last_overlay_bgr)
-        self.status.configure(text=f"Status: Saved overlay PNG -> {Path(path).name}")
+        self._export_async(export_overlay_png, path, self.last_overlay_png, "overlay PNG")
 
     def export_txt_file(self):
         if not self.last_lines or self.image_path is None:
@@ -410,8 +747,7 @@ class App(ctk.CTk):
         )
         if not path:
             return
-        export_txt(path, self.last_lines)
-        self.status.configure(text=f"Status: Saved TXT -> {Path(path).name}")
+        self._export_async(export_txt, path, self.last_lines, "TXT")
 
     def export_csv_file(self):
         if not self.last_lines or self.image_path is None:
@@ -425,8 +761,7 @@ class App(ctk.CTk):
         )
         if not path:
             return
-        export_csv(path, self.last_lines)
-        self.status.configure(text=f"Status: Saved CSV -> {Path(path).name}")
+        self._export_async(export_csv, path, self.last_lines, "CSV")
 
 
 def main():
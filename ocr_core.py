@@ -1,13 +1,24 @@
 \
 from __future__ import annotations
 
-from dataclasses import dataclass
+import csv
+import hashlib
+import os
+import pickle
+import string
+import threading
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
 import easyocr
+import torch
+
+# OpenCV filters below are memory-bound; let them use all but one core
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(1, (os.cpu_count() or 2) - 1))
 
 
 @dataclass
@@ -23,6 +34,13 @@ class OCRConfig:
     contrast_ths: float = 0.03
     adjust_contrast: float = 0.8
 
+    # Recognition throughput: boxes per recognizer batch, DataLoader workers, detector max side
+    recog_batch_size: int = 16
+    workers: int = 0
+    canvas_size: int = 2560
+    # PyTorch intra-op threads for CPU inference; 0 keeps PyTorch's default (physical cores)
+    torch_threads: int = 0
+
     # Output filtering
     min_conf: float = 0.20
 
@@ -30,91 +48,214 @@ class OCRConfig:
     use_allowlist: bool = True
 
 
-DEFAULT_CODE_ALLOWLIST = r"""0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_()[]{}.,=:+-*/\\"'\\\\:;<>#@! """
+DEFAULT_CODE_ALLOWLIST = "".join(sorted(set(string.ascii_letters + string.digits + " _()[]{}.,=:+-*/\\\"';<>#@!")))
+DEFAULT_CODE_ALLOWLIST_SET = frozenset(DEFAULT_CODE_ALLOWLIST)
+
+# On-disk OCR result cache; bump _CACHE_VERSION when the pipeline output changes.
+CACHE_DIR = Path.home() / ".cache" / "easyocr_gui"
+_CACHE_VERSION = 13
+# oldest entries are evicted once the cache directory grows past this
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+# settings that do not change the cached (unfiltered) detections
+_CACHE_KEY_IGNORED = frozenset({"min_conf", "torch_threads"})
+
+_READER_CACHE: Dict[Tuple[str, bool], easyocr.Reader] = {}
+_READER_LOCK = threading.Lock()
+
+
+def get_reader(lang: str, gpu: bool, torch_threads: int = 0) -> easyocr.Reader:
+    """Return a cached EasyOCR reader; model weights are loaded only once per (lang, gpu).
+
+    torch_threads > 0 sets PyTorch's (process-wide) intra-op thread count.
+    """
+    key = (lang, bool(gpu))
+    with _READER_LOCK:
+        if torch_threads > 0 and torch.get_num_threads() != torch_threads:
+            torch.set_num_threads(int(torch_threads))
+        reader = _READER_CACHE.get(key)
+        if reader is None:
+            reader = easyocr.Reader([lang], gpu=gpu, verbose=False)
+            _READER_CACHE[key] = reader
+    return reader
+
+
+def warmup(cfg: OCRConfig) -> None:
+    """Load the reader for cfg ahead of the first OCR run."""
+    get_reader(cfg.lang, cfg.gpu, cfg.torch_threads)
+
+
+_REDUCED_READ_FLAGS = {1: cv2.IMREAD_COLOR, 2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4}
+
+
+def decode_reduction(scale: float) -> int:
+    """Integer downscale to decode at when the OCR scale will shrink the image anyway."""
+    if scale <= 0.3:
+        return 4
+    if scale <= 0.6:
+        return 2
+    return 1
+
 
+def load_image(path: str | Path, reduction: int = 1) -> np.ndarray:
+    """Decode an image as BGR, optionally at 1/reduction size inside the codec.
 
-def load_image(path: str | Path) -> np.ndarray:
-    img = cv2.imread(str(path))
+    Reads through np.fromfile + imdecode so non-ASCII paths work on Windows.
+    """
+    try:
+        data = np.fromfile(str(path), dtype=np.uint8)
+    except OSError:
+        raise FileNotFoundError(f"Image not found: {path}") from None
+    img = decode_image(data, reduction)
     if img is None:
         raise FileNotFoundError(f"Image not found: {path}")
     return img
 
 
-def detect_theme(bgr: np.ndarray) -> str:
-    """Auto-detect theme: 'dark' or 'light' from a screenshot."""
-    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
-    mean = float(np.mean(gray))
-    std = float(np.std(gray))
+def decode_image(data: bytes | np.ndarray, reduction: int = 1) -> Optional[np.ndarray]:
+    """Decode encoded image bytes as BGR (see load_image); None if they are not an image."""
+    buf = np.frombuffer(data, dtype=np.uint8) if isinstance(data, bytes) else data
+    if buf.size == 0:
+        return None  # imdecode asserts on an empty buffer
+    return cv2.imdecode(buf, _REDUCED_READ_FLAGS[reduction])
+
+
+def detect_theme(bgr: np.ndarray) -> Tuple[str, float, float]:
+    """Auto-detect theme from a screenshot. Returns ('dark' | 'light', gray mean, gray std)."""
+    # strided subsample (~256 px on the long side): reads little data but, unlike an
+    # area-averaged thumbnail, keeps the pixel distribution and therefore the std
+    h, w = bgr.shape[:2]
+    step = max(1, max(h, w) // 256)
+    gray = cv2.cvtColor(np.ascontiguousarray(bgr[::step, ::step]), cv2.COLOR_BGR2GRAY)
+    mean = float(gray.mean())
+    std = float(gray.std())
 
     if mean < 115:
-        return "dark"
-    if mean > 165:
-        return "light"
-    return "dark" if mean < 140 and std > 45 else "light"
+        theme = "dark"
+    elif mean > 165:
+        theme = "light"
+    else:
+        theme = "dark" if mean < 140 and std > 45 else "light"
+    return theme, mean, std
 
 
-def _apply_clahe_bgr(bgr: np.ndarray, clip_limit: float = 2.0, tile: Tuple[int, int] = (8, 8)) -> np.ndarray:
-    lab = cv2.cvtColor(bgr, cv2.COLOR_BGR2LAB)
-    l, a, b = cv2.split(lab)
-    clahe = cv2.createCLAHE(clipLimit=float(clip_limit), tileGridSize=tile)
-    l2 = clahe.apply(l)
-    merged = cv2.merge([l2, a, b])
-    return cv2.cvtColor(merged, cv2.COLOR_LAB2BGR)
+# gray std above which a screenshot is contrasted enough to skip CLAHE; compared against
+# detect_theme's std, which comes from a strided subsample and so tracks the full-image std
+CLAHE_SKIP_STD = 60.0
+
+_GAMMA_LUTS: Dict[float, np.ndarray] = {}
+
+
+def _gamma_lut(gamma: float) -> np.ndarray:
+    key = round(float(gamma), 3)
+    table = _GAMMA_LUTS.get(key)
+    if table is None:
+        inv = 1.0 / max(key, 1e-6)
+        table = (np.linspace(0.0, 1.0, 256, dtype=np.float32) ** inv * 255.0).astype(np.uint8)
+        _GAMMA_LUTS[key] = table
+    return table
+
+
+def _gamma(gray: np.ndarray, gamma: float, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    return cv2.LUT(gray, _gamma_lut(gamma), dst=dst)
+
+
+_CLAHE_CACHE: Dict[Tuple[float, Tuple[int, int]], "cv2.CLAHE"] = {}
+_CLAHE_LOCK = threading.Lock()
+
+
+def _apply_clahe(gray: np.ndarray, clip_limit: float, tile: Tuple[int, int], dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """CLAHE with one cached cv2.CLAHE object per parameter set."""
+    key = (float(clip_limit), (int(tile[0]), int(tile[1])))
+    # the CLAHE object keeps internal buffers, so applies are serialized
+    with _CLAHE_LOCK:
+        clahe = _CLAHE_CACHE.get(key)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=key[0], tileGridSize=key[1])
+            _CLAHE_CACHE[key] = clahe
+        return clahe.apply(gray, dst=dst)
+
 
+# filter sizes below were tuned on the image magnified by the OCR scale; at native
+# resolution they are divided by the magnification so they cover the same glyph area
+_SHARPEN_KERNELS: Dict[float, np.ndarray] = {}
 
-def _gamma(gray: np.ndarray, gamma: float) -> np.ndarray:
-    inv = 1.0 / max(gamma, 1e-6)
-    table = (np.array([(i / 255.0) ** inv * 255 for i in range(256)])).astype("uint8")
-    return cv2.LUT(gray, table)
 
+def _sharpen_kernel(mag: float) -> np.ndarray:
+    """Separable Gaussian for the unsharp mask: sigma=3, 13 taps at the magnified size."""
+    key = round(float(mag), 3)
+    kernel = _SHARPEN_KERNELS.get(key)
+    if kernel is None:
+        sigma = 3.0 / key
+        ksize = 2 * max(1, round(2 * sigma)) + 1
+        kernel = cv2.getGaussianKernel(ksize=ksize, sigma=sigma).astype(np.float32)
+        _SHARPEN_KERNELS[key] = kernel
+    return kernel
 
-def preprocess_for_screenshot(bgr: np.ndarray, theme: str, scale: float) -> np.ndarray:
-    """Preprocess screenshot for OCR. Returns GRAY image."""
-    if abs(scale - 1.0) > 1e-6:
-        bgr = cv2.resize(bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
 
-    bgr = _apply_clahe_bgr(bgr, clip_limit=2.0)
-    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+def _smooth_edges(gray: np.ndarray, mag: float = 1.0) -> np.ndarray:
+    """Edge-preserving denoise: guided filter (O(1) per pixel) when opencv-contrib is installed, else bilateral."""
+    ximgproc = getattr(cv2, "ximgproc", None)
+    if ximgproc is not None:
+        return ximgproc.guidedFilter(guide=gray, src=gray, radius=max(1, round(3 / mag)), eps=400)
+    d = 2 * max(1, round(3 / mag)) + 1
+    return cv2.bilateralFilter(gray, d, 50, 50 / mag)
+
+
+def preprocess_for_screenshot(bgr: np.ndarray, theme: str, contrast_std: float = 0.0, mag: float = 1.0) -> np.ndarray:
+    """Preprocess screenshot for OCR at its native resolution. Returns GRAY image.
+
+    Magnification is left to EasyOCR's detector (mag_ratio), so the filters below
+    run on scale**2 fewer pixels. mag is that magnification: smoothing and sharpening
+    radii shrink by it so they act on glyphs as they did on the magnified image.
+
+    Pass order: CLAHE on L -> gamma (dark theme) -> edge-preserving smooth -> unsharp mask.
+    CLAHE and gamma work in place on one single-channel buffer. CLAHE is skipped when
+    contrast_std (from detect_theme) shows the histogram is already well spread.
+    """
+    # LAB lightness is the gray image on both paths (no LAB->BGR->GRAY round-trip after CLAHE),
+    # so skipping CLAHE does not also change the tone curve the later passes see
+    lab = cv2.cvtColor(bgr, cv2.COLOR_BGR2LAB)
+    gray = cv2.extractChannel(lab, 0)
+    del lab  # free the 3-channel frame before the filters allocate theirs
+    if contrast_std <= CLAHE_SKIP_STD:
+        _apply_clahe(gray, clip_limit=2.0, tile=(8, 8), dst=gray)
 
     if theme == "dark":
-        gray = _gamma(gray, gamma=1.25)
+        _gamma(gray, gamma=1.25, dst=gray)
 
-    gray = cv2.bilateralFilter(gray, 7, 50, 50)
-    sharp = cv2.addWeighted(gray, 1.7, cv2.GaussianBlur(gray, (0, 0), 3), -0.7, 0)
-    return sharp
+    gray = _smooth_edges(gray, mag)
+    # unsharp mask; the blend is written into the blur buffer to skip one full-frame allocation
+    kernel = _sharpen_kernel(mag)
+    blurred = cv2.sepFilter2D(gray, cv2.CV_8U, kernel, kernel)
+    sharp = cv2.addWeighted(gray, 1.7, blurred, -0.7, 0, dst=blurred)
+    # EasyOCR takes contiguous uint8 as-is; anything else gets copied/converted inside readtext
+    return np.ascontiguousarray(sharp, dtype=np.uint8)
 
 
-def _bbox_to_rect(bbox: List[List[float]]) -> Tuple[int, int, int, int]:
-    xs = [p[0] for p in bbox]
-    ys = [p[1] for p in bbox]
-    x1, y1, x2, y2 = int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))
-    return x1, y1, x2, y2
+def _quads_to_rects(quads: np.ndarray) -> np.ndarray:
+    """(N, 4, 2) box corners to an (N, 4) int32 array of x1, y1, x2, y2 in one reduction."""
+    return np.concatenate([quads.min(axis=1), quads.max(axis=1)], axis=1).astype(np.int32)
 
 
-def group_into_lines(results: List[Tuple[List[List[float]], str, float]], y_tol: float) -> List[str]:
+def group_into_lines(rects: np.ndarray, texts: List[str], y_tol: float) -> List[str]:
     """Editor-like line ordering: top-to-bottom, left-to-right."""
-    items = []
-    for bbox, text, conf in results:
-        x1, y1, x2, y2 = _bbox_to_rect(bbox)
-        cy = 0.5 * (y1 + y2)
-        items.append((y1, cy, x1, text))
-
-    items.sort(key=lambda t: (t[0], t[2]))
+    cy = 0.5 * (rects[:, 1] + rects[:, 3])
+    # tokens sorted by center y: each one either continues the current line or starts a new one
+    order = np.lexsort((rects[:, 0], cy)).tolist()
+    cys = cy.tolist()
+    x1s = rects[:, 0].tolist()
 
     lines: List[List[Tuple[int, str]]] = []
-    line_cys: List[float] = []
-
-    for y1, cy, x1, text in items:
-        placed = False
-        for i, lcy in enumerate(line_cys):
-            if abs(cy - lcy) <= y_tol:
-                lines[i].append((x1, text))
-                line_cys[i] = 0.7 * line_cys[i] + 0.3 * cy
-                placed = True
-                break
-        if not placed:
-            lines.append([(x1, text)])
-            line_cys.append(cy)
+    current_cy = 0.0
+
+    for i in order:
+        cy = cys[i]
+        if lines and abs(cy - current_cy) <= y_tol:
+            lines[-1].append((x1s[i], texts[i]))
+            current_cy = 0.7 * current_cy + 0.3 * cy
+        else:
+            lines.append([(x1s[i], texts[i])])
+            current_cy = cy
 
     out_lines: List[str] = []
     for line in lines:
@@ -123,12 +264,12 @@ def group_into_lines(results: List[Tuple[List[List[float]], str, float]], y_tol:
     return out_lines
 
 
-def draw_overlay(bgr_scaled: np.ndarray, results: List[Tuple[List[List[float]], str, float]], min_conf: float) -> np.ndarray:
-    out = bgr_scaled.copy()
-    for bbox, text, conf in results:
+def draw_overlay(bgr_scaled: np.ndarray, rects: np.ndarray, texts: List[str], confs: np.ndarray, min_conf: float) -> np.ndarray:
+    """Draw boxes and labels onto bgr_scaled in place and return it."""
+    out = bgr_scaled
+    for (x1, y1, x2, y2), text, conf in zip(rects.tolist(), texts, confs.tolist()):
         if conf < min_conf:
             continue
-        x1, y1, x2, y2 = _bbox_to_rect(bbox)
         cv2.rectangle(out, (x1, y1), (x2, y2), (0, 255, 0), 2)
         label = f"{text} ({conf:.2f})"
         cv2.putText(out, label, (x1, max(0, y1 - 8)), cv2.FONT_HERSHEY_SIMPLEX, 0.65, (0, 255, 0), 2, cv2.LINE_AA)
@@ -136,17 +277,23 @@ def draw_overlay(bgr_scaled: np.ndarray, results: List[Tuple[List[List[float]],
 
 
 def run_ocr(image_path: str | Path, cfg: OCRConfig) -> dict:
-    image_path = Path(image_path)
-    bgr = load_image(image_path)
+    reduction = decode_reduction(cfg.scale)
+    return run_ocr_image(load_image(image_path, reduction), cfg, reduction=reduction)
 
-    theme = detect_theme(bgr)
-    prep = preprocess_for_screenshot(bgr, theme=theme, scale=cfg.scale)
 
-    bgr_scaled = bgr
-    if abs(cfg.scale - 1.0) > 1e-6:
-        bgr_scaled = cv2.resize(bgr, None, fx=cfg.scale, fy=cfg.scale, interpolation=cv2.INTER_CUBIC)
+def run_ocr_image(bgr: np.ndarray, cfg: OCRConfig, reduction: int = 1) -> dict:
+    """Same as run_ocr() for an already decoded BGR image.
+
+    reduction: bgr was decoded at 1/reduction of the original size (see load_image);
+    outputs are still in the frame of the original image times cfg.scale.
+    The overlay is drawn in place, so at an effective scale of 1.0 bgr itself is modified.
+    """
+    mag = float(cfg.scale) * reduction
+
+    theme, _, std = detect_theme(bgr)
+    prep = preprocess_for_screenshot(bgr, theme=theme, contrast_std=std, mag=mag)
 
-    reader = easyocr.Reader([cfg.lang], gpu=cfg.gpu)
+    reader = get_reader(cfg.lang, cfg.gpu, cfg.torch_threads)
 
     kwargs = dict(
         detail=1,
@@ -156,28 +303,121 @@ def run_ocr(image_path: str | Path, cfg: OCRConfig) -> dict:
         link_threshold=float(cfg.link_threshold),
         contrast_ths=float(cfg.contrast_ths),
         adjust_contrast=float(cfg.adjust_contrast),
+        mag_ratio=mag,
+        # EasyOCR's min_size (default 20) applies in input-image pixels; keep the cut-off it had on the upscaled input
+        min_size=max(1, round(20 / mag)),
+        batch_size=int(cfg.recog_batch_size),
+        workers=int(cfg.workers),
+        canvas_size=int(cfg.canvas_size),
     )
     if cfg.use_allowlist:
         kwargs["allowlist"] = DEFAULT_CODE_ALLOWLIST
 
     results = reader.readtext(prep, **kwargs)
 
-    filtered = [(bbox, text, float(conf)) for (bbox, text, conf) in results if float(conf) >= float(cfg.min_conf)]
+    # results to structure-of-arrays once: (N, 4, 2) corners, texts, confidences
+    n = len(results)
+    confs = np.fromiter((r[2] for r in results), dtype=np.float64, count=n)
+    quads = np.asarray([r[0] for r in results], dtype=np.float64).reshape(n, 4, 2)
+
+    # boxes come back in native coordinates; map them onto the scaled frame for grouping and the overlay
+    raw = {
+        "theme": theme,
+        "rects": _quads_to_rects(quads * mag),
+        "texts": [r[1] for r in results],
+        "confs": confs,
+    }
+    return build_result(bgr, raw, cfg, reduction=reduction)
+
+
+def build_result(bgr: np.ndarray, raw: dict, cfg: OCRConfig, reduction: int = 1) -> dict:
+    """Filter unfiltered detections (run_ocr_image's "raw", or a cache entry) by cfg.min_conf
+    and build the lines and overlay for them. bgr and reduction as for run_ocr_image()."""
+    mag = float(cfg.scale) * reduction
+
+    bgr_scaled = bgr
+    if abs(mag - 1.0) > 1e-6:
+        # only a canvas for the debug overlay, so linear is plenty
+        bgr_scaled = cv2.resize(bgr, None, fx=mag, fy=mag, interpolation=cv2.INTER_LINEAR)
+
+    keep = np.nonzero(raw["confs"] >= float(cfg.min_conf))[0]
+    confs = raw["confs"][keep]
+    texts = [raw["texts"][i] for i in keep.tolist()]
+    rects = raw["rects"][keep]
 
     y_tol = 18.0 * max(cfg.scale / 2.5, 0.6)
-    lines = group_into_lines(filtered, y_tol=float(y_tol))
+    lines = group_into_lines(rects, texts, y_tol=float(y_tol))
 
-    overlay = draw_overlay(bgr_scaled, filtered, min_conf=float(cfg.min_conf))
+    overlay = draw_overlay(bgr_scaled, rects, texts, confs, min_conf=float(cfg.min_conf))
 
+    # PNG encoding is left to the caller (encode_png) so it can show the text first
     return {
-        "theme": theme,
+        "theme": raw["theme"],
         "lines": lines,
-        "results": filtered,
+        "rects": rects,
+        "texts": texts,
+        "confs": confs,
         "overlay_bgr": overlay,
-        "bgr_scaled": bgr_scaled,
+        "raw": raw,
     }
 
 
+def cache_key(image_bytes: bytes, cfg: OCRConfig) -> str:
+    """Key for the result cache: hash of the encoded image bytes plus the OCR config.
+
+    min_conf is not part of it: entries hold unfiltered detections (see build_result).
+    """
+    h = hashlib.blake2b(image_bytes, digest_size=16)
+    items = sorted((k, v) for k, v in asdict(cfg).items() if k not in _CACHE_KEY_IGNORED)
+    h.update(repr((_CACHE_VERSION, items)).encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_cached_result(key: str, cache_dir: Path = CACHE_DIR) -> Optional[dict]:
+    """Return the cached unfiltered detections ("raw" of run_ocr_image), or None on a miss."""
+    pkl_path = cache_dir / f"{key}.pkl"
+    try:
+        with pkl_path.open("rb") as f:
+            raw = pickle.load(f)
+        os.utime(pkl_path)  # mark as recently used for eviction
+    except Exception:
+        return None
+    return raw
+
+
+def save_cached_result(key: str, out: dict, cache_dir: Path = CACHE_DIR) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # write-then-rename so a concurrent load never sees a partial pickle
+    tmp_path = cache_dir / f"{key}.pkl.tmp"
+    with tmp_path.open("wb") as f:
+        pickle.dump(out["raw"], f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_dir / f"{key}.pkl")
+    _evict_cache(cache_dir)
+
+
+def _evict_cache(cache_dir: Path, max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """Delete least recently used entries until the cache directory fits in max_bytes.
+
+    .png files are overlays stored by older cache versions.
+    """
+    entries = []
+    total = 0
+    for e in os.scandir(cache_dir):
+        if e.is_file() and e.name.endswith((".pkl", ".png")):
+            st = e.stat()
+            entries.append((st.st_mtime, st.st_size, e.path))
+            total += st.st_size
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
 def export_txt(txt_path: str | Path, lines: List[str]) -> Path:
     txt_path = Path(txt_path)
     txt_path.parent.mkdir(parents=True, exist_ok=True)
@@ -186,19 +426,33 @@ def export_txt(txt_path: str | Path, lines: List[str]) -> Path:
 
 
 def export_csv(csv_path: str | Path, lines: List[str]) -> Path:
-    import csv as _csv
     csv_path = Path(csv_path)
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = _csv.writer(f)
+        w = csv.writer(f)
         w.writerow(["line_no", "text"])
         for i, line in enumerate(lines, start=1):
             w.writerow([i, line])
     return csv_path
 
 
-def export_overlay_png(png_path: str | Path, overlay_bgr: np.ndarray) -> Path:
+# zlib level 1: ~3x faster than OpenCV's default (3) for slightly larger overlay files
+PNG_COMPRESSION = 1
+
+
+def encode_png(bgr: np.ndarray) -> bytes:
+    ok, buf = cv2.imencode(".png", bgr, [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION])
+    if not ok:
+        raise ValueError("PNG encoding failed")
+    return buf.tobytes()
+
+
+def export_overlay_png(png_path: str | Path, overlay: np.ndarray | bytes) -> Path:
+    """Write the overlay; already encoded PNG bytes are written as-is."""
     png_path = Path(png_path)
     png_path.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(png_path), overlay_bgr)
+    if isinstance(overlay, bytes):
+        png_path.write_bytes(overlay)
+    else:
+        cv2.imwrite(str(png_path), overlay, [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION])
     return png_path